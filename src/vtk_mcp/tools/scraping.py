@@ -16,9 +16,9 @@ def get_vtk_class_info_cpp(class_name: str, ctx: "VTKMCPContext") -> str:
     """Get detailed VTK class information from the online C++ docs."""
     if not ctx.settings.enable_cpp_scraping:
         return "C++ scraping disabled (VTK_MCP_ENABLE_CPP_SCRAPING=false)."
-    from .vtk_scraper import VTKClassScraper
+    from .vtk_scraper import get_default_scraper
 
-    scraper = VTKClassScraper()
+    scraper = get_default_scraper()
     info = scraper.get_class_info(class_name)
     if info is None:
         return f"Class '{class_name}' not found in VTK C++ documentation."
@@ -29,9 +29,9 @@ def search_vtk_classes_cpp(search_term: str, ctx: "VTKMCPContext") -> str:
     """Search VTK class names in the C++ docs."""
     if not ctx.settings.enable_cpp_scraping:
         return "C++ scraping disabled (VTK_MCP_ENABLE_CPP_SCRAPING=false)."
-    from .vtk_scraper import VTKClassScraper
+    from .vtk_scraper import get_default_scraper
 
-    scraper = VTKClassScraper()
+    scraper = get_default_scraper()
     matches = scraper.search_classes(search_term)
     if not matches:
         return f"No VTK classes found containing '{search_term}'."
@@ -3,6 +3,12 @@ import re
 import requests
 from bs4 import BeautifulSoup
 
+# Compiled once at import; these run against thousands of anchors per page
+_CLASS_HREF_RE = re.compile(r"class.*\.html")
+_METHOD_ANCHOR_RE = re.compile(r"#a[0-9a-f]+")
+_MEMBER_FUNC_RE = re.compile(r"Member Function|Public.*Function")
+_HASH_RE = re.compile(r"#")
+
 
 class VTKClassScraper:
     def __init__(self):
@@ -29,7 +35,7 @@ class VTKClassScraper:
         except requests.RequestException:
             return None
 
-        soup = BeautifulSoup(response.content, "html.parser")
+        soup = BeautifulSoup(response.content, "lxml")
 
         return self._parse_class_page(soup, class_name)
 
@@ -61,7 +67,7 @@ class VTKClassScraper:
             info["detailed_description"] = " ".join(descriptions[:2])  # Take first 2 meaningful blocks
 
         # Get inheritance information from inheritance diagram or class hierarchy
-        inheritance_links = soup.find_all("a", href=re.compile(r"class.*\.html"))
+        inheritance_links = soup.find_all("a", href=_CLASS_HREF_RE)
         inheritance_classes = []
         for link in inheritance_links:
             class_text = link.get_text(strip=True)
@@ -91,13 +97,13 @@ class VTKClassScraper:
 
         # Approach 2: Look for method definition lists
         if not methods:
-            method_sections = soup.find_all(["h2", "h3"], string=re.compile(r"Member Function|Public.*Function"))
+            method_sections = soup.find_all(["h2", "h3"], string=_MEMBER_FUNC_RE)
             for section in method_sections:
                 next_elem = section.find_next_sibling()
                 while next_elem and next_elem.name not in ["h1", "h2", "h3"]:
                     if next_elem.name == "table":
                         for row in next_elem.find_all("tr"):
-                            method_links = row.find_all("a", href=re.compile(r"#"))
+                            method_links = row.find_all("a", href=_HASH_RE)
                             for link in method_links:
                                 method_name = link.get_text(strip=True)
                                 if method_name and not any(
@@ -113,7 +119,7 @@ class VTKClassScraper:
 
         # Approach 3: Parse all anchor links that look like methods
         if not methods:
-            all_links = soup.find_all("a", href=re.compile(r"#a[0-9a-f]+"))
+            all_links = soup.find_all("a", href=_METHOD_ANCHOR_RE)
             for link in all_links:
                 method_name = link.get_text(strip=True)
                 if (
@@ -150,9 +156,9 @@ class VTKClassScraper:
             response = self.session.get(url, timeout=10)
             response.raise_for_status()
 
-            soup = BeautifulSoup(response.content, "html.parser")
+            soup = BeautifulSoup(response.content, "lxml")
 
-            class_links = soup.find_all("a", href=re.compile(r"class.*\.html"))
+            class_links = soup.find_all("a", href=_CLASS_HREF_RE)
             matches = []
 
             for link in class_links:
@@ -164,3 +170,14 @@ class VTKClassScraper:
 
         except requests.RequestException:
             return []
+
+
+_DEFAULT_SCRAPER = None
+
+
+def get_default_scraper():
+    """Return the process-wide scraper so callers share one pooled session."""
+    global _DEFAULT_SCRAPER
+    if _DEFAULT_SCRAPER is None:
+        _DEFAULT_SCRAPER = VTKClassScraper()
+    return _DEFAULT_SCRAPER
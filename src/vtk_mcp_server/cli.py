@@ -1,17 +1,44 @@
 #!/usr/bin/env python3
 
 import argparse
+import atexit
+import functools
 import json
 import sys
+from contextvars import ContextVar
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
 
 from .vtk_scraper import VTKClassScraper
 
+# Raw stdout for JSON output; flushed once at interpreter exit instead of
+# per write.
+_OUT = sys.stdout.buffer
+atexit.register(sys.stdout.flush)
+
+# Process-wide scraper, shared across client instances so repeated
+# invocations in one process reuse the HTTP session and name trie.
+_scraper_ctx: ContextVar = ContextVar("vtk_mcp_scraper")
+
+
+def _shared_scraper():
+    """Return the context-local VTKClassScraper, creating it once"""
+    try:
+        return _scraper_ctx.get()
+    except LookupError:
+        scraper = VTKClassScraper()
+        _scraper_ctx.set(scraper)
+        return scraper
+
 
 class VTKDocumentationClient:
     """VTK documentation retrieval client"""
 
     def __init__(self, output_format="text"):
-        self.scraper_engine = VTKClassScraper()
+        self.scraper_engine = _shared_scraper()
         self.output_format = output_format
 
     def get_class_info(self, class_identifier):
@@ -54,10 +81,12 @@ class VTKDocumentationClient:
             else:
                 print(error_msg)
 
-    def search_classes(self, search_pattern):
+    def search_classes(self, search_pattern, prefix=False):
         """Search VTK classes matching pattern"""
         try:
-            matching_classes = self.scraper_engine.search_classes(search_pattern)
+            matching_classes = self.scraper_engine.search_classes(
+                search_pattern, prefix=prefix
+            )
             if self.output_format == "json":
                 self._display_json_output(
                     {
@@ -139,7 +168,11 @@ class VTKDocumentationClient:
 
     def _display_json_output(self, data):
         """Display data as formatted JSON"""
-        print(json.dumps(data, indent=2))
+        if orjson is not None:
+            _OUT.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            _OUT.write(b"\n")
+        else:
+            print(json.dumps(data, indent=2))
 
     def _display_class_info(self, class_metadata):
         """Display VTK class information"""
@@ -184,11 +217,7 @@ class VTKDocumentationClient:
         print(f"Documentation URL: {class_metadata['url']}")
 
 
-def main():
-    argument_parser = argparse.ArgumentParser(
-        description="VTK MCP Client - VTK documentation retrieval tool",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+_EPILOG = """
 Usage examples:
   vtk-mcp-client vtkActor                    # Get vtkActor documentation
   vtk-mcp-client --search Actor             # Search for classes containing 'Actor'
@@ -197,7 +226,16 @@ Usage examples:
   vtk-mcp-client PolyData                   # Get vtkPolyData (auto-prefix vtk)
   vtk-mcp-client vtkActor --json             # Get vtkActor in JSON format
   vtk-mcp-client --search Actor --json      # Search in JSON format
-        """,
+        """
+
+
+@functools.cache
+def _build_parser():
+    """Build the argument parser once per process"""
+    argument_parser = argparse.ArgumentParser(
+        description="VTK MCP Client - VTK documentation retrieval tool",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_EPILOG,
     )
 
     command_group = argument_parser.add_mutually_exclusive_group(required=True)
@@ -223,7 +261,18 @@ Usage examples:
         help="Output results in JSON format (MCP server format)",
     )
 
-    parsed_args = argument_parser.parse_args()
+    argument_parser.add_argument(
+        "--prefix",
+        "-p",
+        action="store_true",
+        help="Treat the search pattern as a class-name prefix (trie lookup)",
+    )
+
+    return argument_parser
+
+
+def main():
+    parsed_args = _build_parser().parse_args()
 
     # Initialize documentation client
     output_format = "json" if parsed_args.json else "text"
@@ -236,7 +285,7 @@ Usage examples:
             if not parsed_args.json:
                 print(f"Searching for pattern '{parsed_args.search}'...")
                 print()
-            vtk_client.search_classes(parsed_args.search)
+            vtk_client.search_classes(parsed_args.search, prefix=parsed_args.prefix)
         elif parsed_args.class_name:
             if not parsed_args.json:
                 print(f"Retrieving documentation for '{parsed_args.class_name}'...")
@@ -2,21 +2,64 @@
 
 import asyncio
 import click
-import io
+import importlib.util
+import pydoc
 import sys
-from contextlib import redirect_stdout
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 from fastmcp import FastMCP
-from .vtk_scraper import VTKClassScraper
+from .vtk_scraper import get_default_scraper
+
+
+def _lazy_import_vtk():
+    """Set up a lazy vtk module that loads on first attribute access"""
+    # If vtk is already imported (e.g. by a host application embedding this
+    # server), use it as-is; replacing it in sys.modules with an unexecuted
+    # lazy copy would shadow the live module for everyone
+    if "vtk" in sys.modules:
+        return sys.modules["vtk"]
+
+    spec = importlib.util.find_spec("vtk")
+    if spec is None:
+        return None
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["vtk"] = module
+    loader.exec_module(module)
+    return module
+
+
+# Lazy proxy; None when the vtk package is not installed
+vtk = _lazy_import_vtk()
 
 # Initialize
 mcp = FastMCP("VTK MCP Server")
-scraper = VTKClassScraper()
+scraper = get_default_scraper()
 
 # Global database path (set via CLI)
 _database_path = None
 
 
+class _EmptyResult(Exception):
+    """Raised inside the cached renderers so misses are not memoized.
+
+    The scraper returns None/[] for genuine not-found pages and for
+    transient network failures alike; raising keeps both out of the
+    lru_cache so the next call retries instead of pinning the miss.
+    """
+
+
+@lru_cache(maxsize=1024)
+def _render_cpp_markdown(class_name):
+    """Fetch and render C++ class markdown (memoized per class name)."""
+    info = scraper.get_class_info(class_name)
+    if info is None:
+        raise _EmptyResult(class_name)
+    return _format_class_info(info)
+
+
 @mcp.tool()
 def get_vtk_class_info_cpp(class_name: str) -> str:
     """Get detailed information about a VTK class from online C++ docs."""
@@ -24,14 +67,31 @@ def get_vtk_class_info_cpp(class_name: str) -> str:
         return "Error: class_name is required"
 
     try:
-        info = scraper.get_class_info(class_name)
-        if info is None:
-            return f"Class '{class_name}' not found in VTK documentation."
-        return _format_class_info(info)
+        return _render_cpp_markdown(class_name)
+    except _EmptyResult:
+        return f"Class '{class_name}' not found in VTK documentation."
     except Exception as e:
         return f"Error retrieving class '{class_name}': {str(e)}"
 
 
+@lru_cache(maxsize=1024)
+def _render_search_results(search_term):
+    """Search and render the match list (memoized per term).
+
+    Only non-empty result sets are cached: an empty list can also mean
+    the index fetch failed, and the scraper's own hourly TTL handles
+    staleness for terms that genuinely have no matches.
+    """
+    matches = scraper.search_classes(search_term)
+    if not matches:
+        raise _EmptyResult(search_term)
+
+    response = f"VTK classes containing '{search_term}':\n\n"
+    response += "\n".join(f"{i}. {cls}" for i, cls in enumerate(matches, 1))
+    response += f"\n\nFound {len(matches)} classes."
+    return response
+
+
 @mcp.tool()
 def search_vtk_classes(search_term: str) -> str:
     """Search for VTK classes containing a specific term."""
@@ -39,18 +99,35 @@ def search_vtk_classes(search_term: str) -> str:
         return "Error: search_term is required"
 
     try:
-        matches = scraper.search_classes(search_term)
-        if not matches:
-            return f"No VTK classes found containing '{search_term}'"
-
-        response = f"VTK classes containing '{search_term}':\n\n"
-        response += "\n".join(f"{i}. {cls}" for i, cls in enumerate(matches, 1))
-        response += f"\n\nFound {len(matches)} classes."
-        return response
+        return _render_search_results(search_term)
+    except _EmptyResult:
+        return f"No VTK classes found containing '{search_term}'"
     except Exception as e:
         return f"Error searching for '{search_term}': {str(e)}"
 
 
+@lru_cache(maxsize=512)
+def _render_python_help(class_name: str) -> str:
+    """Render help() output for a VTK class (memoized per class name)."""
+    if vtk is None:
+        raise ImportError("vtk is not installed")
+
+    # Get the class from vtk module (first access triggers the real import)
+    if not hasattr(vtk, class_name):
+        return f"Class '{class_name}' not found in VTK Python API."
+
+    vtk_class = getattr(vtk, class_name)
+
+    # Render the help text directly (no stdout redirection needed)
+    help_text = pydoc.render_doc(vtk_class, renderer=pydoc.plaintext)
+
+    if not help_text:
+        return f"No help documentation available for '{class_name}'"
+
+    # Format the output nicely
+    return f"# Python API Documentation for {class_name}\n\n" f"```\n{help_text}\n```"
+
+
 @mcp.tool()
 def get_vtk_class_info_python(class_name: str) -> str:
     """Get Python API documentation for a VTK class using help()."""
@@ -58,33 +135,11 @@ def get_vtk_class_info_python(class_name: str) -> str:
         return "Error: class_name is required"
 
     try:
-        # Import vtk module
-        import vtk
-
         # Ensure class name starts with 'vtk'
         if not class_name.startswith("vtk"):
             class_name = f"vtk{class_name}"
 
-        # Get the class from vtk module
-        if not hasattr(vtk, class_name):
-            return f"Class '{class_name}' not found in VTK Python API."
-
-        vtk_class = getattr(vtk, class_name)
-
-        # Capture help() output
-        help_output = io.StringIO()
-        with redirect_stdout(help_output):
-            help(vtk_class)
-
-        help_text = help_output.getvalue()
-
-        if not help_text:
-            return f"No help documentation available for '{class_name}'"
-
-        # Format the output nicely
-        return (
-            f"# Python API Documentation for {class_name}\n\n" f"```\n{help_text}\n```"
-        )
+        return _render_python_help(class_name)
 
     except ImportError:
         return (
@@ -234,35 +289,41 @@ def _format_vector_search_results(query, results, top_k):
     return "\n".join(lines)
 
 
-def _format_class_info(info):
-    """Format class info into readable markdown."""
-    lines = [f"# {info['class_name']}", ""]
+def _iter_class_info(info):
+    """Yield markdown lines for a class info dict."""
+    yield f"# {info['class_name']}"
+    yield ""
 
     for section, title in [
         ("brief", "## Brief Description"),
         ("detailed_description", "## Detailed Description"),
     ]:
         if info.get(section):
-            lines.extend([title, info[section], ""])
+            yield title
+            yield info[section]
+            yield ""
 
     if info.get("inheritance"):
-        lines.append("## Inheritance Hierarchy")
-        lines.extend(f"- {cls}" for cls in info["inheritance"])
-        lines.append("")
+        yield "## Inheritance Hierarchy"
+        for cls in info["inheritance"]:
+            yield f"- {cls}"
+        yield ""
 
     if info.get("methods"):
-        lines.append("## Public Methods")
-        methods = info["methods"][:10]  # Show first 10
-        lines.extend(
-            f"- **{m['name']}**: {m.get('description', 'No description')}"
-            for m in methods
-        )
+        yield "## Public Methods"
+        for m in islice(info["methods"], 10):  # Show first 10
+            yield f"- **{m['name']}**: {m.get('description', 'No description')}"
         if len(info["methods"]) > 10:
-            lines.append(f"- ... and {len(info['methods']) - 10} more methods")
-        lines.append("")
+            yield f"- ... and {len(info['methods']) - 10} more methods"
+        yield ""
 
-    lines.extend(["## Documentation URL", info["url"]])
-    return "\n".join(lines)
+    yield "## Documentation URL"
+    yield info["url"]
+
+
+def _format_class_info(info):
+    """Format class info into readable markdown."""
+    return "\n".join(_iter_class_info(info))
 
 
 @click.command()
@@ -289,6 +350,12 @@ def main(transport, host, port, database_path):
         click.echo(f"Database path configured: {database_path}")
 
     if transport == "http":
+        try:
+            import uvloop
+
+            uvloop.install()
+        except ImportError:
+            pass  # Fall back to the stock asyncio event loop
         click.echo(f"Starting VTK MCP Server on http://{host}:{port}")
         asyncio.run(mcp.run_http_async(host=host, port=port))
     else:
@@ -1,9 +1,52 @@
 #!/usr/bin/env python3
 
+import copy
 import json
+import re
 import sys
 import click
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:  # pragma: no cover - orjson is optional
+    _json_loads = json.loads
+
+    def _json_dumps(payload):
+        return json.dumps(payload).encode("utf-8")
+
+
+# Matches the first SSE data frame in a raw response body
+_SSE_DATA_RE = re.compile(rb"^data: (.+)$", re.MULTILINE)
+
+# Shared JSON-RPC envelope for tool calls; a frozen prototype that is
+# copied, never mutated, so every payload is independent of the next call.
+_TOOL_CALL_TEMPLATE = {
+    "jsonrpc": "2.0",
+    "id": "1",
+    "method": "tools/call",
+    "params": {"name": "", "arguments": None},
+}
+
+
+def _tool_call_payload(request_id, tool_name, arguments):
+    """Build a tools/call payload from the shared envelope.
+
+    Shallow-copies the envelope and params per call and copies the
+    caller's arguments dict, so neither the template nor an in-flight
+    payload can be changed out from under anyone.
+    """
+    payload = dict(_TOOL_CALL_TEMPLATE)
+    params = dict(payload["params"])
+    payload["id"] = request_id
+    params["name"] = tool_name
+    params["arguments"] = copy.copy(arguments)
+    payload["params"] = params
+    return payload
 
 
 class SimpleVTKClient:
@@ -12,7 +55,23 @@ class SimpleVTKClient:
     def __init__(self, base_url="http://localhost:8000"):
         self.base_url = base_url
         self.session_id = None
-        self._initialize_session()
+        self.session = requests.Session()
+        self.session.mount(
+            "http://", HTTPAdapter(pool_connections=2, pool_maxsize=8, max_retries=0)
+        )
+        self.session.headers.update(
+            {
+                "Content-Type": "application/json",
+                "Accept": "application/json, text/event-stream",
+            }
+        )
+        self._handshake_done = False
+
+    def _ensure_session(self):
+        """Perform the MCP handshake once, on first tool use"""
+        if not self._handshake_done:
+            self._handshake_done = True
+            self._initialize_session()
 
     def _initialize_session(self):
         """Initialize MCP session with handshake"""
@@ -47,16 +106,13 @@ class SimpleVTKClient:
 
     def _make_request(self, payload):
         """Make HTTP request with proper headers"""
-        headers = {
-            "Content-Type": "application/json",
-            "Accept": "application/json, text/event-stream",
-        }
+        headers = {}
         if self.session_id:
             headers["Mcp-Session-Id"] = self.session_id
 
         try:
-            response = requests.post(
-                f"{self.base_url}/mcp/", json=payload, headers=headers
+            response = self.session.post(
+                f"{self.base_url}/mcp/", data=_json_dumps(payload), headers=headers
             )
             if response.status_code != 200:
                 print(f"HTTP {response.status_code}: {response.text}")
@@ -69,9 +125,9 @@ class SimpleVTKClient:
     def _parse_response(self, response):
         """Parse SSE response and extract result"""
         try:
-            for line in response.text.strip().split("\n"):
-                if line.startswith("data: "):
-                    return json.loads(line[6:])  # Remove 'data: ' prefix
+            match = _SSE_DATA_RE.search(response.content)
+            if match:
+                return _json_loads(match.group(1))
         except Exception as e:
             print(f"Parse error: {e}")
         return None
@@ -87,15 +143,10 @@ class SimpleVTKClient:
 
     def get_class_info_cpp(self, class_name):
         """Get VTK C++ class information"""
-        payload = {
-            "jsonrpc": "2.0",
-            "id": "1",
-            "method": "tools/call",
-            "params": {
-                "name": "get_vtk_class_info_cpp",
-                "arguments": {"class_name": class_name},
-            },
-        }
+        self._ensure_session()
+        payload = _tool_call_payload(
+            "1", "get_vtk_class_info_cpp", {"class_name": class_name}
+        )
         response = self._make_request(payload)
         if response:
             result = self._parse_response(response)
@@ -103,15 +154,10 @@ class SimpleVTKClient:
 
     def search_classes(self, search_term):
         """Search VTK classes"""
-        payload = {
-            "jsonrpc": "2.0",
-            "id": "2",
-            "method": "tools/call",
-            "params": {
-                "name": "search_vtk_classes",
-                "arguments": {"search_term": search_term},
-            },
-        }
+        self._ensure_session()
+        payload = _tool_call_payload(
+            "2", "search_vtk_classes", {"search_term": search_term}
+        )
         response = self._make_request(payload)
         if response:
             result = self._parse_response(response)
@@ -119,15 +165,10 @@ class SimpleVTKClient:
 
     def get_class_info_python(self, class_name):
         """Get VTK Python API information"""
-        payload = {
-            "jsonrpc": "2.0",
-            "id": "3",
-            "method": "tools/call",
-            "params": {
-                "name": "get_vtk_class_info_python",
-                "arguments": {"class_name": class_name},
-            },
-        }
+        self._ensure_session()
+        payload = _tool_call_payload(
+            "3", "get_vtk_class_info_python", {"class_name": class_name}
+        )
         response = self._make_request(payload)
         if response:
             result = self._parse_response(response)
@@ -137,19 +178,12 @@ class SimpleVTKClient:
         self, query, collection_name="vtk-examples", top_k=5
     ):
         """Search VTK examples using vector search"""
-        payload = {
-            "jsonrpc": "2.0",
-            "id": "4",
-            "method": "tools/call",
-            "params": {
-                "name": "vector_search_vtk_examples",
-                "arguments": {
-                    "query": query,
-                    "collection_name": collection_name,
-                    "top_k": top_k,
-                },
-            },
-        }
+        self._ensure_session()
+        payload = _tool_call_payload(
+            "4",
+            "vector_search_vtk_examples",
+            {"query": query, "collection_name": collection_name, "top_k": top_k},
+        )
         response = self._make_request(payload)
         if response:
             result = self._parse_response(response)
@@ -157,6 +191,7 @@ class SimpleVTKClient:
 
     def list_tools(self):
         """List available MCP tools"""
+        self._ensure_session()
         payload = {"jsonrpc": "2.0", "id": "3", "method": "tools/list"}
         response = self._make_request(payload)
         if not response:
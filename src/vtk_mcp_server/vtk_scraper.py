@@ -1,18 +1,79 @@
 import re
+import time
+from dataclasses import dataclass
+from itertools import islice
+
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Compiled once at import; these run against thousands of anchors per page
+_CLASS_HREF_RE = re.compile(r"class.*\.html")
+_METHOD_ANCHOR_RE = re.compile(r"#a[0-9a-f]+")
+_MEMBER_FUNC_RE = re.compile(r"Member Function|Public.*Function")
+_HASH_RE = re.compile(r"#")
+_BLACKLIST_RE = re.compile(r"class|struct|enum|typedef", re.IGNORECASE)
+_VALID_CLASS_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+
+# The annotated.html index changes rarely; refetch at most hourly
+_INDEX_TTL_SECONDS = 3600
+
+# Only these tags are ever queried, so skip building the rest of the DOM
+_CLASS_PAGE_STRAINER = SoupStrainer(["div", "table", "a", "h2", "h3"])
+_ANCHOR_STRAINER = SoupStrainer("a")
+
+
+def _fast_text(tag):
+    """Text of a tag, skipping the recursive get_text walk for leaf tags"""
+    text = tag.string
+    return text.strip() if text else tag.get_text(strip=True)
+
+
+@dataclass(slots=True)
+class _Method:
+    """Compact method record used while collecting scrape results"""
+
+    name: str
+    description: str
+
+
+_DEFAULT_SCRAPER = None
+
+
+def get_default_scraper():
+    """Return the process-wide scraper, keeping its session and caches warm"""
+    global _DEFAULT_SCRAPER
+    if _DEFAULT_SCRAPER is None:
+        _DEFAULT_SCRAPER = VTKClassScraper()
+    return _DEFAULT_SCRAPER
 
 
 class VTKClassScraper:
     def __init__(self):
         self.base_url = "https://vtk.org/doc/nightly/html"
+        self._name_trie = None
+        self._class_info_cache = {}
+        self._class_names = None
+        self._name_index = []
+        self._index_fetched_at = 0.0
         self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]
+            ),
+        )
+        self.session.mount("https://", adapter)
         self.session.headers.update(
             {
                 "User-Agent": (
                     "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
                     "(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-                )
+                ),
+                "Accept-Encoding": "gzip, deflate",
+                "Connection": "keep-alive",
             }
         )
 
@@ -20,17 +81,33 @@ class VTKClassScraper:
         if not class_name.startswith("vtk"):
             class_name = f"vtk{class_name}"
 
+        # Names with spaces, slashes, etc. always 404; skip the round-trip
+        if not _VALID_CLASS_RE.fullmatch(class_name):
+            return None
+
+        cached = self._class_info_cache.get(class_name)
+        if cached is not None:
+            return cached
+
         url = f"{self.base_url}/class{class_name}.html"
 
+        # A non-streaming get reads the whole body before returning, so a
+        # mid-body timeout surfaces here as a RequestException rather than
+        # escaping from the parser, and the pooled connection is released
+        # automatically
         try:
             response = self.session.get(url, timeout=10)
             response.raise_for_status()
         except requests.RequestException:
             return None
 
-        soup = BeautifulSoup(response.content, "html.parser")
+        soup = BeautifulSoup(
+            response.content, "lxml", parse_only=_CLASS_PAGE_STRAINER
+        )
 
-        return self._parse_class_page(soup, class_name)
+        info = self._parse_class_page(soup, class_name)
+        self._class_info_cache[class_name] = info
+        return info
 
     def _parse_class_page(self, soup, class_name):
         info = {
@@ -48,128 +125,209 @@ class VTKClassScraper:
         if title_elem:
             info["brief"] = title_elem.get_text(strip=True)
 
-        # Get detailed description from multiple textblock divs
+        # Get detailed description from multiple textblock divs; take the
+        # first 2 meaningful blocks without materializing the rest
         textblocks = soup.find_all("div", class_="textblock")
-        descriptions = []
-        for block in textblocks:
-            text = block.get_text(strip=True)
-            if text and len(text) > 20:  # Filter out very short text
-                descriptions.append(text)
-
-        if descriptions:
-            info["detailed_description"] = " ".join(
-                descriptions[:2]
-            )  # Take first 2 meaningful blocks
+        block_texts = (block.get_text(strip=True) for block in textblocks)
+        info["detailed_description"] = " ".join(
+            islice((text for text in block_texts if len(text) > 20), 2)
+        )
 
         # Get inheritance information from inheritance diagram or class hierarchy
-        inheritance_links = soup.find_all("a", href=re.compile(r"class.*\.html"))
+        inheritance_links = soup.find_all("a", href=_CLASS_HREF_RE)
         inheritance_classes = []
         for link in inheritance_links:
-            class_text = link.get_text(strip=True)
+            class_text = _fast_text(link)
             if class_text.startswith("vtk") and class_text != class_name:
                 inheritance_classes.append(class_text)
 
         # Remove duplicates and limit
         info["inheritance"] = list(dict.fromkeys(inheritance_classes))[:10]
 
-        # Get public methods - try multiple approaches
-        methods = []
-
-        # Approach 1: Look for method tables
-        method_tables = soup.find_all("table", class_="memberdecls")
-        for table in method_tables:
-            rows = table.find_all("tr")
-            for row in rows:
-                # Look for method signatures
-                method_cell = row.find("td", class_="memItemRight")
-                if method_cell:
-                    method_link = method_cell.find("a")
-                    if method_link:
-                        method_name = method_link.get_text(strip=True)
-                        # Get the full method signature
-                        method_sig = method_cell.get_text(strip=True)
-                        methods.append({"name": method_name, "description": method_sig})
-
-        # Approach 2: Look for method definition lists
+        # Get public methods - try multiple approaches. Methods are keyed by
+        # name as they are collected, first occurrence winning, so the
+        # 50-method cap counts unique names: duplicates (overloads) must not
+        # burn cap slots that dedup would free up again afterwards.
+        methods = {}
+
+        # Approach 1: Look for method tables. A single compiled CSS selector
+        # replaces the nested table/row/cell find_all loops. Only the first
+        # anchor per cell is the method; later anchors are parameter and
+        # return-type class links.
+        for method_cell in soup.select("table.memberdecls td.memItemRight"):
+            method_link = method_cell.find("a")
+            if method_link is None:
+                continue
+            method_name = _fast_text(method_link)
+            if method_name not in methods:
+                # The cell holds the full method signature
+                methods[method_name] = _Method(method_name, _fast_text(method_cell))
+                if len(methods) >= 50:
+                    break
+
+        # Approach 2: Look for method definition lists; the cap is checked
+        # at every loop level so hitting it stops the whole scan
         if not methods:
-            method_sections = soup.find_all(
-                ["h2", "h3"], string=re.compile(r"Member Function|Public.*Function")
-            )
+            method_sections = soup.find_all(["h2", "h3"], string=_MEMBER_FUNC_RE)
             for section in method_sections:
+                if len(methods) >= 50:
+                    break
                 next_elem = section.find_next_sibling()
-                while next_elem and next_elem.name not in ["h1", "h2", "h3"]:
+                while (
+                    next_elem
+                    and next_elem.name not in ["h1", "h2", "h3"]
+                    and len(methods) < 50
+                ):
                     if next_elem.name == "table":
                         for row in next_elem.find_all("tr"):
-                            method_links = row.find_all("a", href=re.compile(r"#"))
+                            if len(methods) >= 50:
+                                break
+                            method_links = row.find_all("a", href=_HASH_RE)
                             for link in method_links:
-                                method_name = link.get_text(strip=True)
-                                if method_name and not any(
-                                    x in method_name.lower()
-                                    for x in ["class", "struct", "enum"]
+                                method_name = _fast_text(link)
+                                if (
+                                    method_name
+                                    and method_name not in methods
+                                    and not _BLACKLIST_RE.search(method_name)
                                 ):
-                                    methods.append(
-                                        {
-                                            "name": method_name,
-                                            "description": f"Method: {method_name}",
-                                        }
+                                    methods[method_name] = _Method(
+                                        method_name, f"Method: {method_name}"
                                     )
+                                    if len(methods) >= 50:
+                                        break
                     next_elem = next_elem.find_next_sibling()
 
-        # Approach 3: Parse all anchor links that look like methods
+        # Approach 3: Parse anchor links that look like methods. Iterate the
+        # candidate containers and scan their anchors so the context element
+        # is already in hand, instead of walking find_parent from every
+        # link. Containers are visited deepest-first (reversed document
+        # order), so each anchor is claimed by its nearest td/div/span and
+        # the seen-set stops outer containers from re-adding it.
         if not methods:
-            all_links = soup.find_all("a", href=re.compile(r"#a[0-9a-f]+"))
-            for link in all_links:
-                method_name = link.get_text(strip=True)
+            seen_links = set()
+            for parent in reversed(soup.find_all(["td", "div", "span"])):
+                if len(methods) >= 50:
+                    break
+                for link in parent.find_all("a", href=_METHOD_ANCHOR_RE):
+                    if id(link) in seen_links:
+                        continue
+                    seen_links.add(id(link))
+                    method_name = _fast_text(link)
+                    if (
+                        method_name
+                        and len(method_name) > 2
+                        and method_name not in methods
+                        and not _BLACKLIST_RE.search(method_name)
+                    ):
+                        # The enclosing container gives the method context
+                        context = parent.get_text(strip=True)
+                        methods[method_name] = _Method(
+                            method_name,
+                            context[:200] if context else f"Method: {method_name}",
+                        )
+                        if len(methods) >= 50:
+                            break
+
+            # Anchors outside any container keep the name-only fallback
+            for link in soup.find_all("a", href=_METHOD_ANCHOR_RE):
+                if len(methods) >= 50:
+                    break
+                if id(link) in seen_links:
+                    continue
+                method_name = _fast_text(link)
                 if (
                     method_name
                     and len(method_name) > 2
-                    and not any(
-                        x in method_name.lower()
-                        for x in ["class", "struct", "enum", "typedef"]
-                    )
+                    and method_name not in methods
+                    and not _BLACKLIST_RE.search(method_name)
                 ):
-                    # Try to get context for the method
-                    parent = link.find_parent(["td", "div", "span"])
-                    context = parent.get_text(strip=True) if parent else method_name
-                    methods.append(
-                        {
-                            "name": method_name,
-                            "description": (
-                                context[:200] if context else f"Method: {method_name}"
-                            ),
-                        }
+                    methods[method_name] = _Method(
+                        method_name, f"Method: {method_name}"
                     )
 
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_methods = []
-        for method in methods:
-            if method["name"] not in seen:
-                seen.add(method["name"])
-                unique_methods.append(method)
-
-        info["methods"] = unique_methods[:50]  # Limit to 50 methods
+        # Already deduplicated in first-seen order; expand to plain dicts
+        # at the boundary so callers keep the JSON-friendly shape
+        info["methods"] = [
+            {"name": method.name, "description": method.description}
+            for method in methods.values()
+        ]
 
         return info
 
-    def search_classes(self, search_term):
+    def search_classes(self, search_term, prefix=False):
         """Search for VTK classes containing the search term"""
+        if prefix:
+            return self.search_classes_prefix(search_term)
+
+        needle = search_term.lower()
+        self._fetch_class_names()
+        matches = {orig for orig, lowered in self._name_index if needle in lowered}
+        return sorted(matches)[:20]  # Limit to 20 results
+
+    def _fetch_class_names(self):
+        """Fetch (and cache) the list of VTK class names from the annotated index"""
+        index_age = time.monotonic() - self._index_fetched_at
+        if self._class_names is not None and index_age < _INDEX_TTL_SECONDS:
+            return self._class_names
+
+        # As in get_class_info: read the body inside the guard so network
+        # failures at any point come back as an empty result
         try:
             url = f"{self.base_url}/annotated.html"
             response = self.session.get(url, timeout=10)
             response.raise_for_status()
+        except requests.RequestException:
+            return []
 
-            soup = BeautifulSoup(response.content, "html.parser")
+        soup = BeautifulSoup(response.content, "lxml", parse_only=_ANCHOR_STRAINER)
+        class_links = soup.find_all("a", href=_CLASS_HREF_RE)
+        names = {_fast_text(link) for link in class_links}
+        self._class_names = sorted(name for name in names if name)
+        self._name_index = [(name, name.lower()) for name in self._class_names]
+        self._index_fetched_at = time.monotonic()
+        self._name_trie = None  # Rebuilt lazily from the fresh index
+        return self._class_names
 
-            class_links = soup.find_all("a", href=re.compile(r"class.*\.html"))
-            matches = []
+    def build_name_trie(self):
+        """Build (and cache) a character trie over all VTK class names
 
-            for link in class_links:
-                class_name = link.get_text(strip=True)
-                if search_term.lower() in class_name.lower():
-                    matches.append(class_name)
+        Each node is a dict keyed by character; complete names are stored
+        under the "" sentinel key. Prefix search then descends the trie in
+        O(len(prefix)) instead of scanning every class name.
+        """
+        if self._name_trie is not None:
+            return self._name_trie
 
-            return sorted(list(set(matches)))[:20]  # Limit to 20 results
+        names = self._fetch_class_names()
+        trie = {}
+        for class_name in names:
+            node = trie
+            for char in class_name:
+                node = node.setdefault(char, {})
+            node[""] = class_name
 
-        except requests.RequestException:
-            return []
+        # Only cache when the fetch produced names; a failed index fetch
+        # would otherwise pin an empty trie for the process lifetime
+        if names:
+            self._name_trie = trie
+        return trie
+
+    def search_classes_prefix(self, prefix):
+        """Search for VTK classes whose name starts with the given prefix"""
+        node = self.build_name_trie()
+        for char in prefix:
+            node = node.get(char)
+            if node is None:
+                return []
+
+        matches = []
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            for key, child in current.items():
+                if key == "":
+                    matches.append(child)
+                else:
+                    stack.append(child)
+
+        return sorted(matches)[:20]  # Limit to 20 results
@@ -6,6 +6,7 @@ import time
 import threading
 import socket
 from unittest.mock import patch
+from vtk_mcp_server import server
 from vtk_mcp_server.server import mcp
 from vtk_mcp_server.simple_client import SimpleVTKClient
 
@@ -13,6 +14,23 @@ from vtk_mcp_server.simple_client import SimpleVTKClient
 pytestmark = [pytest.mark.integration, pytest.mark.http]
 
 
+@pytest.fixture(autouse=True)
+def clear_render_caches():
+    """Empty the server's memoized renderers around every test.
+
+    The renderers cache per-argument at module level, so a result cached
+    by one test (e.g. markdown for vtkSphere) would short-circuit the
+    scraper in the next one and mask whatever behavior it patched in.
+    """
+    for cached in (
+        server._render_cpp_markdown,
+        server._render_search_results,
+        server._render_python_help,
+    ):
+        cached.cache_clear()
+    yield
+
+
 class TestHTTPIntegration:
     """Test client-server integration over HTTP transport."""
 
@@ -2,7 +2,8 @@
 
 import pytest
 from unittest.mock import patch, MagicMock
-import io
+import pydoc
+from functools import lru_cache
 
 
 pytestmark = pytest.mark.unit
@@ -10,13 +11,13 @@ pytestmark = pytest.mark.unit
 
 def get_vtk_class_info_cpp_func(class_name: str) -> str:
     """Local copy of the C++ info function for testing."""
-    from vtk_mcp_server.vtk_scraper import VTKClassScraper
+    from vtk_mcp_server.vtk_scraper import get_default_scraper
 
     if not class_name:
         return "Error: class_name is required"
 
     try:
-        scraper = VTKClassScraper()
+        scraper = get_default_scraper()
         info = scraper.get_class_info(class_name)
         if info is None:
             return f"Class '{class_name}' not found in VTK documentation."
@@ -54,10 +55,19 @@ def get_vtk_class_info_cpp_func(class_name: str) -> str:
         return f"Error retrieving class '{class_name}': {str(e)}"
 
 
+@lru_cache(maxsize=256)
+def _python_help_for(class_name: str) -> str:
+    """Render help() output for a VTK class (memoized per class name)."""
+    import vtk
+
+    vtk_class = getattr(vtk, class_name)
+
+    # Render the help text directly (no stdout redirection needed)
+    return pydoc.render_doc(vtk_class, title="%s", renderer=pydoc.plaintext)
+
+
 def get_vtk_class_info_python_func(class_name: str) -> str:
     """Local copy of the Python info function for testing."""
-    from contextlib import redirect_stdout
-
     if not class_name:
         return "Error: class_name is required"
 
@@ -73,14 +83,7 @@ def get_vtk_class_info_python_func(class_name: str) -> str:
         if not hasattr(vtk, class_name):
             return f"Class '{class_name}' not found in VTK Python API."
 
-        vtk_class = getattr(vtk, class_name)
-
-        # Capture help() output
-        help_output = io.StringIO()
-        with redirect_stdout(help_output):
-            help(vtk_class)
-
-        help_text = help_output.getvalue()
+        help_text = _python_help_for(class_name)
 
         if not help_text:
             return f"No help documentation available for '{class_name}'"
@@ -101,13 +104,13 @@ def get_vtk_class_info_python_func(class_name: str) -> str:
 
 def search_vtk_classes_func(search_term: str) -> str:
     """Local copy of the search function for testing."""
-    from vtk_mcp_server.vtk_scraper import VTKClassScraper
+    from vtk_mcp_server.vtk_scraper import get_default_scraper
 
     if not search_term:
         return "Error: search_term is required"
 
     try:
-        scraper = VTKClassScraper()
+        scraper = get_default_scraper()
         matches = scraper.search_classes(search_term)
         if not matches:
             return f"No VTK classes found containing '{search_term}'"
@@ -123,11 +126,11 @@ def search_vtk_classes_func(search_term: str) -> str:
 class TestServerFunctionsCpp:
     """Test the C++ documentation function."""
 
-    @patch("vtk_mcp_server.vtk_scraper.VTKClassScraper")
-    def test_get_vtk_class_info_cpp_success(self, mock_scraper_class):
+    @patch("vtk_mcp_server.vtk_scraper.get_default_scraper")
+    def test_get_vtk_class_info_cpp_success(self, mock_get_scraper):
         """Test successful C++ class info retrieval."""
         mock_scraper = MagicMock()
-        mock_scraper_class.return_value = mock_scraper
+        mock_get_scraper.return_value = mock_scraper
         mock_scraper.get_class_info.return_value = {
             "class_name": "vtkSphere",
             "brief": "Test brief description",
@@ -149,11 +152,11 @@ class TestServerFunctionsCpp:
         assert "SetRadius" in result
         mock_scraper.get_class_info.assert_called_once_with("vtkSphere")
 
-    @patch("vtk_mcp_server.vtk_scraper.VTKClassScraper")
-    def test_get_vtk_class_info_cpp_not_found(self, mock_scraper_class):
+    @patch("vtk_mcp_server.vtk_scraper.get_default_scraper")
+    def test_get_vtk_class_info_cpp_not_found(self, mock_get_scraper):
         """Test C++ class info when class not found."""
         mock_scraper = MagicMock()
-        mock_scraper_class.return_value = mock_scraper
+        mock_get_scraper.return_value = mock_scraper
         mock_scraper.get_class_info.return_value = None
 
         result = get_vtk_class_info_cpp_func("NonExistentClass")
@@ -198,11 +201,11 @@ class TestServerFunctionsPython:
 class TestServerFunctionsSearch:
     """Test the search classes function."""
 
-    @patch("vtk_mcp_server.vtk_scraper.VTKClassScraper")
-    def test_search_vtk_classes_success(self, mock_scraper_class):
+    @patch("vtk_mcp_server.vtk_scraper.get_default_scraper")
+    def test_search_vtk_classes_success(self, mock_get_scraper):
         """Test successful class search."""
         mock_scraper = MagicMock()
-        mock_scraper_class.return_value = mock_scraper
+        mock_get_scraper.return_value = mock_scraper
         mock_scraper.search_classes.return_value = [
             "vtkCamera",
             "vtkCameraActor",
@@ -218,11 +221,11 @@ class TestServerFunctionsSearch:
         assert "Found 3 classes" in result
         mock_scraper.search_classes.assert_called_once_with("Camera")
 
-    @patch("vtk_mcp_server.vtk_scraper.VTKClassScraper")
-    def test_search_vtk_classes_no_results(self, mock_scraper_class):
+    @patch("vtk_mcp_server.vtk_scraper.get_default_scraper")
+    def test_search_vtk_classes_no_results(self, mock_get_scraper):
         """Test search when no classes found."""
         mock_scraper = MagicMock()
-        mock_scraper_class.return_value = mock_scraper
+        mock_get_scraper.return_value = mock_scraper
         mock_scraper.search_classes.return_value = []
 
         result = search_vtk_classes_func("NonExistentTerm")